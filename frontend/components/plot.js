@@ -23,10 +23,9 @@ const linspace = (start, stop, num) => {
 };
 
 const geomspace = (start, stop, num) => {
-  const step = (Math.log(stop) - Math.log(start)) / num;
-  return Array.from({ length: num }, (_, i) =>
-    Math.exp(Math.log(start) + step * i)
-  );
+  const logStart = Math.log(start);
+  const step = (Math.log(stop) - logStart) / num;
+  return Array.from({ length: num }, (_, i) => Math.exp(logStart + step * i));
 };
 
 export const formatTimeTick = (n) => {
@@ -53,9 +52,9 @@ const denser = (xs) => {
 };
 
 export const functionToPlotData = (range, f, id = "foo") => {
-  const xs = range;
-  const xys = xs.map((x) => ({ x: x, y: f(x) }));
-  return { id, data: [...xys] }; // , color: "#f47560"
+  // evaluate f in a single pass, without copying the points afterwards
+  const data = range.map((x) => ({ x: x, y: f(x) }));
+  return { id, data }; // , color: "#f47560"
 };
 
 const tooltipElement = (props) => {
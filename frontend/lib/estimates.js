@@ -134,99 +134,110 @@ const line = ([x1, y1], [x2, y2]) => {
   return [m, b];
 };
 
+// the lagrange polynomials (lines) between consecutive benchmark points,
+// stored as flat arrays of slopes and intercepts.
+const segments = ({ range, results }) => {
+  const slopes = new Float64Array(range.length - 1);
+  const intercepts = new Float64Array(range.length - 1);
+  for (let i = 0; i < range.length - 1; i++) {
+    [slopes[i], intercepts[i]] = line(
+      [range[i], results[i]],
+      [range[i + 1], results[i + 1]]
+    );
+  }
+  return { slopes, intercepts };
+};
+
+// the samples sorted by size, which the estimators rely on. benchmark results
+// are usually sorted already, in which case they are returned unchanged.
+const sortSamples = (samples) => {
+  const { range, results } = samples;
+  if (range.every((x, i) => i === 0 || range[i - 1] <= x)) {
+    return samples;
+  }
+  const order = range.map((_, i) => i).sort((i, j) => range[i] - range[j]);
+  return {
+    range: order.map((i) => range[i]),
+    results: order.map((i) => results[i]),
+  };
+};
+
+// binary search for the lagrange poly to use for n, that is the last point of
+// the (sorted) range not greater than n, leaving out the last point.
+const segmentIndex = (range, n) => {
+  let lo = 0;
+  let hi = range.length - 2;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (range[mid] <= n) {
+      lo = mid;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return lo;
+};
+
+// least-squares line through the points (x, y)
 function linearRegression(x, y) {
   const avgX = x.reduce((prev, curr) => prev + curr, 0) / x.length;
-  const xDifferencesToAverage = x.map((value) => avgX - value);
-  const xDifferencesToAverageSquared = xDifferencesToAverage.map(
-    (value) => value ** 2
-  );
-  const SSxx = xDifferencesToAverageSquared.reduce(
-    (prev, curr) => prev + curr,
-    0
-  );
-  const sumY = y.reduce((prev, curr) => prev + curr, 0);
-  const avgY = sumY / y.length;
-  const yDifferencesToAverage = y.map((value) => avgY - value);
-  const xAndYDifferencesMultiplied = xDifferencesToAverage.map(
-    (curr, index) => curr * yDifferencesToAverage[index]
-  );
-  const SSxy = xAndYDifferencesMultiplied.reduce(
-    (prev, curr) => prev + curr,
-    0
-  );
+  const avgY = y.reduce((prev, curr) => prev + curr, 0) / y.length;
+  let SSxx = 0;
+  let SSxy = 0;
+  for (let i = 0; i < x.length; i++) {
+    SSxx += (avgX - x[i]) ** 2;
+    SSxy += (avgX - x[i]) * (avgY - y[i]);
+  }
   const slope = SSxy / SSxx;
   const intercept = avgY - slope * avgX;
   return (x) => intercept + slope * x;
 }
 
 const simpleEstimation = (samples) => {
-  return (n) => n * samples.results[0];
+  const slope = samples.results[0];
+  return (n) => n * slope;
 };
 
 const nLognEstimation = (samples) => {
+  const { slopes, intercepts } = segments(samples);
+  // the regression is linear in ys, so scaling them by log2(n) and dividing
+  // the result by log2(n) cancels out: fit the last samples once.
+  const extrapolate = linearRegression(
+    samples.range.slice(-regressionSet),
+    samples.results.slice(-regressionSet)
+  );
   return (n) => {
-    let { range, results } = samples;
+    const { range } = samples;
     if (n > range[range.length - 1]) { // extrapolate to the right (do regression)
-      const xs =
-        n < range[0]
-          ? range.slice(0, regressionSet)
-          : range.slice(-regressionSet);
-      let ys =
-        n < range[0]
-          ? results.slice(0, regressionSet)
-          : results.slice(-regressionSet);
-      ys = ys.map((x) => x * Math.log2(n));
-      const extrapolate = linearRegression(xs, ys);
-      return extrapolate(n) / Math.log2(n);
+      return extrapolate(n);
     } else if (n < range[0]) { // extrapolate to the left (use the first lagrange poly)
-      let [p, q] = [
-        [range[0], results[0]],
-        [range[1], results[1]],
-      ];
-      const [m, b] = line(p, q);
-      return m * n + b;
+      return slopes[0] * n + intercepts[0];
     } else { // interpolate within benchmark bounds (find the right lagrange poly)
-      let i = 0;
-      while (range[i] <= n && i < range.length - 1) {
-        i++;
-      }
-      i--;
-      let [p, q] = [
-        [range[i], results[i]],
-        [range[i + 1], results[i + 1]],
-      ];
-      const [m, b] = line(p, q);
-      return m * n + b;
+      const i = segmentIndex(range, n);
+      return slopes[i] * n + intercepts[i];
     }
   };
 };
 
 const linearEstimation = (samples) => {
+  const { slopes, intercepts } = segments(samples);
+  const extrapolateLeft = linearRegression(
+    samples.range.slice(0, regressionSet),
+    samples.results.slice(0, regressionSet)
+  );
+  const extrapolateRight = linearRegression(
+    samples.range.slice(-regressionSet),
+    samples.results.slice(-regressionSet)
+  );
   return (n) => {
-    let { range, results } = samples;
-    if (n < range[0] || range[range.length - 1] < n) {
-      const xs =
-        n < range[0]
-          ? range.slice(0, regressionSet)
-          : range.slice(-regressionSet);
-      const ys =
-        n < range[0]
-          ? results.slice(0, regressionSet)
-          : results.slice(-regressionSet);
-      const extrapolate = linearRegression(xs, ys);
-      return extrapolate(n);
+    const { range } = samples;
+    if (n < range[0]) {
+      return extrapolateLeft(n);
+    } else if (range[range.length - 1] < n) {
+      return extrapolateRight(n);
     } else {
-      let i = 0;
-      while (range[i] <= n && i < range.length - 1) {
-        i++;
-      }
-      i--;
-      let [p, q] = [
-        [samples.range[i], results[i]],
-        [samples.range[i + 1], results[i + 1]],
-      ];
-      const [m, b] = line(p, q);
-      return m * n + b;
+      const i = segmentIndex(range, n);
+      return slopes[i] * n + intercepts[i];
     }
   };
 };
@@ -238,6 +249,10 @@ const estimating_functions = {
   msm_Gt: linearEstimation,
 };
 
+// estimators only depend on their samples, so build each of them once:
+// they are requested again for every ingredient at every render.
+const estimators = {};
+
 export const estimator = (curve, lib, machine, op) => {
   if (!(curve in estimates)) {
     throw new Error(`Curve ${curve} not found`);
@@ -246,9 +261,13 @@ export const estimator = (curve, lib, machine, op) => {
   } else if (!(machine in estimates[curve][lib])) {
     throw new Error(`Machine ${machine} not found`);
   } else if (op in estimates[curve][lib][machine]) {
-    let samples = estimates[curve][lib][machine][op];
-    let f = estimating_functions[op] || estimating_functions["default"];
-    return f(samples);
+    const key = [curve, lib, machine, op].join("/");
+    if (!(key in estimators)) {
+      let samples = sortSamples(estimates[curve][lib][machine][op]);
+      let f = estimating_functions[op] || estimating_functions["default"];
+      estimators[key] = f(samples);
+    }
+    return estimators[key];
   } else {
     return (n) => null;
   }
@@ -11,8 +11,8 @@ export const filterSamples = (samples, f) => {
     if (typeof samples === "undefined") {
       return null;
     }
-    const xys = samples.range.map((x, i) => ({ x: x, y: samples.results[i] }));
-    return { id, data: [...xys] }; // , color: "#e8c1a0"
+    const data = samples.range.map((x, i) => ({ x: x, y: samples.results[i] }));
+    return { id, data }; // , color: "#e8c1a0"
   };
 
   export const samplesToBarData = (samples,  label = "label", id = "operation") => {
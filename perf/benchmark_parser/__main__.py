@@ -1,16 +1,16 @@
 import argparse
 
-from . import criterion
-from . import golang
-
 
 def main():
     parser = argparse.ArgumentParser(prog="parser")
     parser.add_argument('benchmark_engine', choices=['criterion', 'golang'])
     args = parser.parse_args()
+    # Only import the parser that is going to be used
     if args.benchmark_engine == 'criterion':
+        from . import criterion
         criterion.main()
     else:
+        from . import golang
         golang.main()
 
 
@@ -1,13 +1,19 @@
+import json
 import re
 import sys
 
+def compile_probes(probes):
+    """Compile the regular expressions of `probes`, once, keeping their order"""
+    return [(re.compile(probe), name) for probe, name in probes.items()]
+
+
 def parse_benchmark_description(description, probes):
-    # match description against the list of probes
-    for probe in probes:
-        match = re.match(probe, description)
+    # match description against the list of compiled probes
+    for probe, name in probes:
+        match = probe.match(description)
 
         if match is not None:
-            familiar_name = probes[probe](*match.groups())
+            familiar_name = name(*match.groups())
             print(f'✅ probe matched {description}', file=sys.stderr)
             return familiar_name
     else:
@@ -15,9 +21,53 @@ def parse_benchmark_description(description, probes):
         raise NotImplementedError
 
 
+# nanoseconds in each time unit
+NANOSECONDS = {"ns": 1, "µs": 1e3, "ms": 1e6, "s": 1e9}
+
+
 def to_nanoseconds(num, unit_str):
     """Convert `num` in `unit_str` to nanoseconds"""
-    units = {"ns": 1, "µs": 1e3, "ms": 1e6, "s": 1e9}
-    return num * units[unit_str]
+    return num * NANOSECONDS[unit_str]
+
+
+def extract_measurements(benchmarks, probes):
+    """Match (description, time_in_nanoseconds) `benchmarks` against `probes`"""
+    # Measurements in a flat dictionary: { (operation_id, size) : time_in_nanoseconds },
+    # where operations are interned in order of appearance.
+    operation_ids = {}
+    measurements = {}
+
+    for description, measurement_in_ns in benchmarks:
+        try:
+            operation, size = parse_benchmark_description(description, probes)
+        except NotImplementedError:
+            continue
+
+        operation_id = operation_ids.setdefault(operation, len(operation_ids))
+        measurements[operation_id, size] = measurement_in_ns
+
+    return list(operation_ids), measurements
+
+
+def export_measurements(operations, measurements):
+    """Export these measurements in json, grouped by operation and sorted by size"""
+    results = {operation: {"range": [], "results": []} for operation in operations}
+    # Sorting on (operation id, size) keeps operations in order of appearance
+    for (operation_id, size), time in sorted(measurements.items()):
+        result = results[operations[operation_id]]
+        result["range"].append(size)
+        # float32 precision: more digits are just measurement noise
+        result["results"].append(float(f"{time:.7g}"))
+    return results
+
 
+def write_measurements(benchmarks, probes, outs):
+    """Extract the measurements of `benchmarks` and write them as json to `outs`"""
+    operations, measurements = extract_measurements(benchmarks, probes)
+    # Re-format the measurements into a dictionary: {operation : {range: [sizes], results: [times]}
+    results = export_measurements(operations, measurements)
 
+    # Encode the functions as a compact JSON object
+    json_data = json.dumps(results, separators=(",", ":"))
+    # Write the JSON object to the file
+    outs.write(json_data)
@@ -5,9 +5,8 @@ Usage:
 """
 import sys
 import json
-from collections import defaultdict
 
-from .common import to_nanoseconds, parse_benchmark_description
+from .common import NANOSECONDS, compile_probes, write_measurements
 
 ark_names = {
     'Double': 'double',
@@ -41,7 +40,7 @@ op_ids = [
     "pairing",
 ]
 
-probes = {
+probes = compile_probes({
     # zkalc naming convention
 
     # arkworks probes
@@ -63,49 +62,21 @@ probes = {
     r'Arithmetic for .*::Fr/Sum of products of size (\d)': lambda x: (f"ip_ff", int(x)),
 
     f'Arithmetic for .*::Fr/({"|".join(ark_names.keys())})': lambda y: (f"{ark_names[y]}_ff", 1),
-}
-
-def export_measurement(measurement):
-    """Export this measurement in json"""
-    # Get the sizes and times from the data
-    sizes, times = zip(*measurement.items())
-    return {"range": sizes, "results": times}
-
-
-def extract_measurements(bench_output):
-    measurements = defaultdict(dict)
+})
 
-    # Parse benchmarks and make them ready for fitting
+def criterion_benchmarks(bench_output):
+    """Yield (description, time_in_nanoseconds) for each criterion benchmark"""
     for measurement in bench_output:
         # Skip useless non-benchmark lines
         if "id" not in measurement:
             continue
 
-        # Extra data from json
-        try:
-            operation, size = parse_benchmark_description(measurement["id"], probes)
-        except NotImplementedError:
-            continue
-
-        measurement_in_ns = to_nanoseconds(
-            measurement["mean"]["estimate"], measurement["mean"]["unit"])
-        measurements[operation][size] = measurement_in_ns
-
-    return measurements
+        mean = measurement["mean"]
+        yield measurement["id"], mean["estimate"] * NANOSECONDS[mean["unit"]]
 
 
 def main(ins=sys.stdin, outs=sys.stdout):
-    bench_output = [json.loads(line) for line in sys.stdin if line.strip()]
-    # Dictionary of results in format: { operation : measurements }
-    results = {}
-    # Extract measurements into a nested dictionary: { operation : {size : time_in_microseconds }}
-    measurements = extract_measurements(bench_output)
-    # Re-format the measurements into a dictionary: {operation : {range: [sizes], results: [times]}
-    results = {operation: export_measurement(
-        measurements[operation]) for operation in measurements}
-
-    # Encode the functions as a JSON object
-    json_data = json.dumps(results)
-    # Write the JSON object to the file
-    outs.write(json_data)
-
+    # Decode lines lazily, so that they are parsed and filtered in a single pass.
+    # Lines without an "id" are not benchmarks: skip them before decoding.
+    bench_output = (json.loads(line) for line in ins if '"id"' in line)
+    write_measurements(criterion_benchmarks(bench_output), probes, outs)
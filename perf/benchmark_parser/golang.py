@@ -1,9 +1,9 @@
 #!/usr/bin/env python
 import json
 import re, io, sys
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict
 
-from .common import to_nanoseconds, parse_benchmark_description
+from .common import to_nanoseconds, compile_probes, write_measurements
 
 def parse_benchline(line):
     """
@@ -37,7 +37,7 @@ def load_benchmarks(f):
     benchmarks = []
 
     # For each line, attempt to read a benchmark
-    for line in f.readlines():
+    for line in f:
         bl = parse_benchline(line)
         if bl is not None:
             benchmarks.append(bl)
@@ -45,7 +45,7 @@ def load_benchmarks(f):
 
     return benchmarks, labels
 
-probes = {
+probes = compile_probes({
     r'ElementAdd':                    lambda:   ("add_ff", 1),
     r'ElementMul':                    lambda:   ("mul_ff", 1),
     r'ElementInverse':                lambda:   ("invert", 1),
@@ -63,37 +63,9 @@ probes = {
     r'E12Mul':                        lambda:  ("mul_Gt", 1),
     r'Pairing':                       lambda:  ("pairing", 1),
     r'MultiPair/(\d+)_pairs':         lambda x: ("msm_Gt", int(x)),
-}
-
-def export_measurement(measurement):
-    """Export this measurement in json"""
-    # Get the sizes and times from the data
-    sizes, times = zip(*measurement.items())
-    return {"range": sizes, "results": times}
-
-def extract_measurements(benchmarks):
-    measurements = defaultdict(dict)
-
-    for benchline in benchmarks:
-        try:
-            operation, size = parse_benchmark_description(benchline[0], probes)
-        except NotImplementedError:
-            continue
-
-        measurements[operation][size] = benchline[2]
-
-    return measurements
+})
 
 # if invoked as main just print statistics
 def main(ins=sys.stdin, outs=sys.stdout):
     benchmarks, labels = load_benchmarks(ins)
-    measurements = extract_measurements(benchmarks)
-
-    # Re-format the measurements into a dictionary: {operation : {range: [sizes], results: [times]}
-    results = {operation: export_measurement(measurements[operation]) for operation in measurements}
-
-    # Encode the functions as a JSON object
-    json_data = json.dumps(results)
-    # Write the JSON object to the file
-    outs.write(json_data)
-
+    write_measurements(((name, time) for name, _, time in benchmarks), probes, outs)